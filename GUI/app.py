@@ -5,6 +5,20 @@ from tkinter import messagebox
 import mysql.connector
 from db_config import DB_CONFIG  # Import your database configuration
 import re  # For email and contact validation
+import time  # For timing in-memory graph queries
+import threading  # Report generation runs in the background
+import queue
+from change_feed import ChangeFeed, TABLE_KEYS, CASCADE_CHILDREN, make_row_key
+from network_graph import NetworkGraph, GRAPH_TABLES
+from report_generator import generate_reports
+from dedup import DedupIndex, DEFAULT_THRESHOLD
+from temporal import PORTFOLIO_AS_OF_QUERY, end_of_day, portfolio_as_of_params
+
+DUP_CHECK_DELAY_MS = 300  # Check for duplicates once the user pauses typing
+STRONG_DUP_SCORE = 0.9    # Ask for confirmation before inserting a record this similar
+
+POLL_INTERVAL_MS = 2000  # How often to check for changes made by other clients
+MAX_PATCH_ROWS = 500     # Above this many changed rows, reloading the table is cheaper
 
 class App(ctk.CTk):
     def __init__(self):
@@ -45,17 +59,46 @@ class App(ctk.CTk):
         self.tab_view = ctk.CTkTabview(self)
         self.tab_view.pack(expand=True, fill="both", padx=10, pady=10)
 
+        # --- Live tables: Treeviews showing a whole table, kept current via the change feed ---
+        self.live_tables = {}  # {treeview: table_name}
+        self.change_feed = ChangeFeed(DB_CONFIG)
+        self.feed_queue = queue.Queue()  # Results of the polling thread
+        self.network_graph = None  # Loaded on first use, then kept current by the change feed
+        self.graph_loading = None  # [callbacks to run once loaded] while loading in the background
+        self.graph_pending = []    # Change-feed updates received while loading
+        self.graph_stale = False   # Too much changed while loading: load again once it finishes
+        self.graph_queue = queue.Queue()  # Result of the loading thread
+        self.dedup_indexes = {}    # {'founders' / 'mentors' / 'investors': DedupIndex}, same lifecycle
+        self.dedup_loading = {}    # {entity: [callbacks to run once loaded]} while loading in the background
+        self.dedup_pending = {}    # {entity: [functions applying change-feed updates received while loading]}
+        self.dedup_failed = {}     # {entity: error}; not retried until the user runs a scan
+        self.dedup_queue = queue.Queue()  # Messages from the loading/scanning threads to the GUI
+        self.dedup_polling = False        # Whether check_dedup_queue is scheduled
+        self.dup_scan_index = None        # Index find_duplicates is iterating in the background
+        self.dup_scan_pending = []        # Change-feed updates for it, applied once the scan finishes
+        self.dup_check_jobs = {}   # {label: pending after() id}
+
         # Add tabs
         self.tab_view.add("View All Data (Read)")
         self.tab_view.add("Manage Startups (CRUD)")
         self.tab_view.add("Procedures & Functions")
         self.tab_view.add("Complex Queries & Triggers")
+        self.tab_view.add("Network Graph")
+        self.tab_view.add("Portfolio Reports")
+        self.tab_view.add("Duplicate Detection")
 
         # --- Populate each tab ---
         self.create_tab_1_view_data()
         self.create_tab_2_manage_startups()
         self.create_tab_3_proc_func()
         self.create_tab_4_queries_triggers()
+        self.create_tab_5_network_graph()
+        self.create_tab_6_reports()
+        self.create_tab_7_duplicates()
+
+        # --- Start polling for changes made by other clients ---
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.after(POLL_INTERVAL_MS, self.poll_changes)
 
     # --- Database Connection Helper ---
     def get_db_connection(self):
@@ -67,7 +110,10 @@ class App(ctk.CTk):
             return None
 
     # --- Generic Function to Display Query Results in a Treeview ---
-    def display_in_treeview(self, tree, query, params=()):
+    def display_in_treeview(self, tree, query, params=(), key_columns=None):
+        # The tree no longer shows a plain table (load_live_table re-registers it)
+        self.live_tables.pop(tree, None)
+
         # Clear existing data
         for item in tree.get_children():
             tree.delete(item)
@@ -89,21 +135,8 @@ class App(ctk.CTk):
                 messagebox.showinfo("Query Info", "Query executed, but returned no results.")
                 return
 
-            # --- Define Treeview Columns ---
             column_names = [desc[0] for desc in cursor.description]
-            tree["columns"] = column_names
-            tree["displaycolumns"] = column_names
-            
-            for col in column_names:
-                tree.heading(col, text=col)
-                tree.column(col, width=120, anchor="center") # Centered
-            
-            tree.heading("#0", text="Row")
-            tree.column("#0", width=40, anchor="center")
-            
-            # --- Insert Data into Treeview ---
-            for i, row in enumerate(rows):
-                tree.insert("", "end", text=str(i+1), values=row)
+            self.display_rows_in_treeview(tree, column_names, rows, key_columns)
 
         except mysql.connector.Error as err:
             messagebox.showerror("Query Error", f"Error executing query: {err}")
@@ -112,6 +145,181 @@ class App(ctk.CTk):
                 cursor.close()
                 conn.close()
 
+    # --- Display Already-Fetched Rows in a Treeview ---
+    def display_rows_in_treeview(self, tree, column_names, rows, key_columns=None):
+        self.live_tables.pop(tree, None)
+        for item in tree.get_children():
+            tree.delete(item)
+
+        # --- Define Treeview Columns ---
+        tree["columns"] = column_names
+        tree["displaycolumns"] = column_names
+        
+        for col in column_names:
+            tree.heading(col, text=col)
+            tree.column(col, width=120, anchor="center") # Centered
+        
+        tree.heading("#0", text="Row")
+        tree.column("#0", width=40, anchor="center")
+        
+        # --- Insert Data into Treeview ---
+        # With key_columns, each item's iid is the row's primary key so it can be patched later
+        key_indexes = [column_names.index(col) for col in key_columns] if key_columns else None
+        for i, row in enumerate(rows):
+            if key_indexes:
+                tree.insert("", "end", iid=make_row_key(row[k] for k in key_indexes), text=str(i+1), values=row)
+            else:
+                tree.insert("", "end", text=str(i+1), values=row)
+
+    # --- Show a whole table in a Treeview and keep it current ---
+    def load_live_table(self, tree, table):
+        key_columns = TABLE_KEYS.get(table)
+        self.display_in_treeview(tree, f"SELECT * FROM {table}", key_columns=key_columns)
+        if key_columns:
+            self.live_tables[tree] = table
+
+    # --- Cross-Instance Change Polling ---
+    # The database work runs in a background thread, one step at a time, and reports through
+    # feed_queue, so a slow or unreachable server never blocks the GUI.
+    def poll_changes(self):
+        self.run_feed_step(lambda: ("changes",) + self.change_feed.poll())
+
+    def run_feed_step(self, step):
+        def run():
+            try:
+                self.feed_queue.put(step())
+            except Exception as err:  # Always report back, or polling would stop
+                self.feed_queue.put(("error", err))
+
+        threading.Thread(target=run, daemon=True).start()
+        self.after(100, self.check_feed_queue)
+
+    def check_feed_queue(self):
+        try:
+            message = self.feed_queue.get_nowait()
+        except queue.Empty:
+            self.after(100, self.check_feed_queue)
+            return
+
+        next_step = None
+        try:
+            if message[0] == "changes":
+                _, changes, versions = message
+                next_step = self.plan_changes(changes, versions)
+            elif message[0] == "rows":
+                _, fetched, versions = message
+                self.apply_changes(fetched)
+                self.change_feed.advance(versions)  # Only now are these changes applied everywhere
+            else:  # "error"
+                self.change_feed.close()  # Retry with a fresh connection on the next poll
+        finally:
+            # Whatever failed, the same changes are picked up again by the next poll
+            if next_step:
+                self.run_feed_step(next_step)
+            else:
+                self.after(POLL_INTERVAL_MS, self.poll_changes)
+
+    def plan_changes(self, changes, versions):
+        # changes = {table_name: [(row_key, op), ...]}
+        # Returns the background step that reads the changed rows, or None if there are none to read.
+        changed_keys = {table: list(dict.fromkeys(key for key, op in row_changes))
+                        for table, row_changes in changes.items()}
+
+        # Deleting a parent row also removes/updates child rows (ON DELETE CASCADE / SET NULL)
+        # without firing their triggers, so re-check the matching child rows on screen and in
+        # the duplicate indexes.
+        for parent, row_changes in changes.items():
+            deleted_ids = {key for key, op in row_changes if op == "D"}
+            if not deleted_ids:
+                continue
+            for child, fk_column in CASCADE_CHILDREN.get(parent, []):
+                for tree, table in self.live_tables.items():
+                    columns = list(tree["columns"])
+                    if table != child or fk_column not in columns:
+                        continue
+                    fk_index = columns.index(fk_column)
+                    for iid in tree.get_children():
+                        if str(tree.item(iid, "values")[fk_index]) in deleted_ids:
+                            changed_keys.setdefault(child, []).append(iid)
+
+                if fk_column != "startup_id":
+                    continue
+                startup_ids = {int(key) for key in deleted_ids}
+                dedup_index = self.dedup_indexes.get(child)
+                if dedup_index:
+                    changed_keys.setdefault(child, []).extend(str(record_id) for record_id in dedup_index.records_of_startups(startup_ids))
+                elif child in self.dedup_loading:
+                    # Which records are affected is only known once the index has loaded
+                    self.dedup_pending.setdefault(child, []).append(lambda index, ids=startup_ids: index.remove_startups(ids))
+
+        to_fetch = {}
+        for table, row_keys in changed_keys.items():
+            row_keys = list(dict.fromkeys(row_keys))
+            trees = [tree for tree, t in self.live_tables.items() if t == table]
+            update_graph = table in GRAPH_TABLES and (self.network_graph is not None or self.graph_loading is not None)
+            dedup_index = self.dedup_indexes.get(table)
+            dedup_loading = table in self.dedup_loading
+            if not trees and not update_graph and not dedup_index and not dedup_loading:
+                continue
+
+            if len(row_keys) > MAX_PATCH_ROWS:
+                for tree in trees:
+                    self.load_live_table(tree, table)
+                if update_graph:
+                    self.rebuild_network_graph()
+                self.dedup_indexes.pop(table, None)  # Reloaded on next use
+            else:
+                to_fetch[table] = row_keys
+
+        if not to_fetch:
+            self.change_feed.advance(versions)
+            return None
+        return lambda: ("rows", {table: (row_keys,) + self.change_feed.fetch_rows(table, row_keys)
+                                 for table, row_keys in to_fetch.items()}, versions)
+
+    def apply_changes(self, fetched):
+        # fetched = {table_name: (row_keys, column_names, {row_key: row})}
+        for table, (row_keys, column_names, rows) in fetched.items():
+            for tree in [tree for tree, t in self.live_tables.items() if t == table]:
+                self.patch_treeview(tree, table, row_keys, rows)
+            if table in GRAPH_TABLES:
+                if self.network_graph is not None:
+                    self.network_graph.apply_rows(table, column_names, row_keys, rows)
+                elif self.graph_loading is not None:
+                    # The loading snapshot may predate this change; re-applying it later is harmless
+                    self.graph_pending.append((table, column_names, row_keys, rows))
+
+            dedup_index = self.dedup_indexes.get(table)
+            if dedup_index and dedup_index is self.dup_scan_index:
+                # The scan thread is iterating this index, so it must not change until the scan ends
+                self.dup_scan_pending.append((column_names, row_keys, rows))
+            elif dedup_index:
+                dedup_index.apply_rows(column_names, row_keys, rows)
+            elif table in self.dedup_loading:
+                # The loading snapshot may predate this change; re-applying it later is harmless
+                self.dedup_pending.setdefault(table, []).append(
+                    lambda index, args=(column_names, row_keys, rows): index.apply_rows(*args))
+
+    def patch_treeview(self, tree, table, row_keys, rows):
+        # Columns are only known once the table has been loaded with at least one row
+        if not tree["columns"]:
+            self.load_live_table(tree, table)
+            return
+
+        for key in row_keys:
+            row = rows.get(key)
+            if row is None:
+                if tree.exists(key):
+                    tree.delete(key)  # Deleted
+            elif tree.exists(key):
+                tree.item(key, values=row)  # Updated
+            else:
+                tree.insert("", "end", iid=key, text=str(len(tree.get_children()) + 1), values=row)  # Inserted
+
+    def on_close(self):
+        self.change_feed.close()
+        self.destroy()
+
     # ===================================================================
     # TAB 1: VIEW ALL DATA (Read Operation)
     # ===================================================================
@@ -131,7 +339,7 @@ class App(ctk.CTk):
         for i, table in enumerate(tables):
             btn = ctk.CTkButton(button_frame, text=f"Load {table}", 
                                 font=self.default_font,
-                                command=lambda t=table: self.display_in_treeview(self.view_tree, f"SELECT * FROM {t}"))
+                                command=lambda t=table: self.load_live_table(self.view_tree, t))
             btn.grid(row=0, column=i, padx=5, pady=5)
 
     # ===================================================================
@@ -182,7 +390,7 @@ class App(ctk.CTk):
         self.refresh_startup_tree() # Load data on start
 
     def refresh_startup_tree(self):
-        self.display_in_treeview(self.startup_tree, "SELECT * FROM startups")
+        self.load_live_table(self.startup_tree, "startups")
 
     def on_startup_select(self, event):
         try:
@@ -354,6 +562,10 @@ class App(ctk.CTk):
         self.proc_btn = ctk.CTkButton(proc_frame, text="Run Procedure", font=self.default_font, command=self.call_add_startup_procedure)
         self.proc_btn.grid(row=5, column=0, columnspan=4, pady=10)
 
+        self.proc_dup_label = ctk.CTkLabel(proc_frame, text="", text_color="orange", font=ctk.CTkFont(size=14))
+        self.proc_dup_label.grid(row=6, column=0, columnspan=4)
+        self.watch_for_duplicates("founders", self.proc_dup_label, self.proc_f_name, self.proc_f_email)
+
         # --- Procedure 2 Demo: sp_AssignMentorToStartup ---
         proc2_frame = ctk.CTkFrame(tab)
         proc2_frame.pack(fill="x", padx=10, pady=10)
@@ -447,6 +659,9 @@ class App(ctk.CTk):
         if not (f_contact.isdigit() and len(f_contact) == 10):
             messagebox.showerror("Validation Error", "Invalid contact. Must be exactly 10 digits.")
             return
+
+        if not self.confirm_not_duplicate("founders", f_name, f_email):
+            return
         # --- END VALIDATION ---
 
         conn = self.get_db_connection()
@@ -500,7 +715,7 @@ class App(ctk.CTk):
             
             # Refresh the table in Tab 1 (in case the user is viewing it)
             if self.view_tree:
-                 self.display_in_treeview(self.view_tree, "SELECT * FROM startup_mentors")
+                 self.load_live_table(self.view_tree, "startup_mentors")
 
 
         except mysql.connector.Error as err:
@@ -559,6 +774,10 @@ class App(ctk.CTk):
         self.trigger2_btn = ctk.CTkButton(trigger2_frame, text="Run Insert (Fires Trigger 2)", font=self.default_font, command=self.fire_add_founder_trigger)
         self.trigger2_btn.grid(row=3, column=0, columnspan=4, pady=10)
 
+        self.trg2_dup_label = ctk.CTkLabel(trigger2_frame, text="", text_color="orange", font=ctk.CTkFont(size=14))
+        self.trg2_dup_label.grid(row=4, column=0, columnspan=4)
+        self.watch_for_duplicates("founders", self.trg2_dup_label, self.trg2_f_name, self.trg2_f_email)
+
         # --- ADD NEW MENTOR ---
         mentor_frame = ctk.CTkFrame(tab)
         mentor_frame.pack(fill="x", padx=10, pady=10)
@@ -576,6 +795,10 @@ class App(ctk.CTk):
         self.add_mentor_btn = ctk.CTkButton(mentor_frame, text="Add Mentor", font=self.default_font, command=self.add_new_mentor)
         self.add_mentor_btn.grid(row=2, column=0, columnspan=4, pady=10)
 
+        self.mentor_dup_label = ctk.CTkLabel(mentor_frame, text="", text_color="orange", font=ctk.CTkFont(size=14))
+        self.mentor_dup_label.grid(row=3, column=0, columnspan=4)
+        self.watch_for_duplicates("mentors", self.mentor_dup_label, self.mentor_name_entry)
+
 
         # --- Audit Log Viewer (For both triggers) ---
         ctk.CTkLabel(tab, text="Audit Log (Shows Trigger Results)", font=self.default_font).pack(pady=(10, 0))
@@ -601,6 +824,10 @@ class App(ctk.CTk):
         self.agg_btn = ctk.CTkButton(btn_frame, text="AGGREGATE Query", font=self.default_font, command=self.run_aggregate_query)
         self.agg_btn.pack(side="left", expand=True, padx=5)
 
+        # Optional point-in-time date for the aggregate query (empty = current data)
+        self.agg_as_of_entry = ctk.CTkEntry(btn_frame, width=160, font=self.default_font, placeholder_text="As of YYYY-MM-DD")
+        self.agg_as_of_entry.pack(side="left", padx=5)
+
         self.nested_btn = ctk.CTkButton(btn_frame, text="NESTED Query", font=self.default_font, command=self.run_nested_query)
         self.nested_btn.pack(side="left", expand=True, padx=5)
 
@@ -658,6 +885,9 @@ class App(ctk.CTk):
         if not (contact.isdigit() and len(contact) == 10):
             messagebox.showerror("Validation Error", "Invalid contact. Must be exactly 10 digits.")
             return
+
+        if not self.confirm_not_duplicate("founders", name, email):
+            return
         # --- END VALIDATION ---
 
         query = "INSERT INTO founders (name, email, contact, startup_id) VALUES (%s, %s, %s, %s)"
@@ -695,6 +925,9 @@ class App(ctk.CTk):
             messagebox.showerror("Error", "Please fill in all fields.")
             return
 
+        if not self.confirm_not_duplicate("mentors", name):
+            return
+
         query = "INSERT INTO mentors (name, expertise_area) VALUES (%s, %s)"
         params = (name, expertise)
 
@@ -712,7 +945,7 @@ class App(ctk.CTk):
             
             # Refresh mentors table in Tab 1
             if self.view_tree:
-                self.display_in_treeview(self.view_tree, "SELECT * FROM mentors")
+                self.load_live_table(self.view_tree, "mentors")
 
         except mysql.connector.Error as err:
             messagebox.showerror("Error", f"Failed to add mentor: {err}. (Check if Name is unique)")
@@ -741,6 +974,17 @@ class App(ctk.CTk):
         self.display_in_treeview(self.query_result_tree, query)
 
     def run_aggregate_query(self):
+        as_of_text = self.agg_as_of_entry.get().strip()
+        if as_of_text:
+            # AGGREGATE AS OF: totals and stages as they were at the end of the given day (history tables)
+            try:
+                as_of = end_of_day(as_of_text)
+            except ValueError:
+                messagebox.showerror("Error", "Invalid date. Please use the format YYYY-MM-DD.")
+                return
+            self.display_in_treeview(self.query_result_tree, PORTFOLIO_AS_OF_QUERY, portfolio_as_of_params(as_of))
+            return
+
         # AGGREGATE: Get total funding per startup (using the function)
         query = """
         SELECT 
@@ -768,6 +1012,444 @@ class App(ctk.CTk):
         """
         self.display_in_treeview(self.query_result_tree, query)
 
+    # ===================================================================
+    # TAB 5: NETWORK GRAPH (Co-Investment & Mentorship)
+    # ===================================================================
+    def create_tab_5_network_graph(self):
+        tab = self.tab_view.tab("Network Graph")
+
+        # --- Ranking Queries ---
+        rank_frame = ctk.CTkFrame(tab)
+        rank_frame.pack(fill="x", padx=10, pady=10)
+
+        ctk.CTkLabel(rank_frame, text="Investor & Mentor Network (funding + startup_mentors)", font=ctk.CTkFont(weight="bold")).grid(row=0, column=0, columnspan=3, pady=5)
+
+        self.co_invest_btn = ctk.CTkButton(rank_frame, text="Top Co-Investors", font=self.default_font, command=self.run_co_investor_query)
+        self.co_invest_btn.grid(row=1, column=0, padx=5, pady=5)
+
+        self.shared_mentor_btn = ctk.CTkButton(rank_frame, text="Startups Sharing Mentors", font=self.default_font, command=self.run_shared_mentors_query)
+        self.shared_mentor_btn.grid(row=1, column=1, padx=5, pady=5)
+
+        self.rebuild_graph_btn = ctk.CTkButton(rank_frame, text="Rebuild Graph", font=self.default_font, fg_color="grey", command=self.rebuild_network_graph)
+        self.rebuild_graph_btn.grid(row=1, column=2, padx=5, pady=5)
+
+        # --- Shortest Path ---
+        path_frame = ctk.CTkFrame(tab)
+        path_frame.pack(fill="x", padx=10, pady=10)
+
+        ctk.CTkLabel(path_frame, text="Shortest Path: Investor to Startup", font=ctk.CTkFont(weight="bold")).grid(row=0, column=0, columnspan=5, pady=5)
+
+        ctk.CTkLabel(path_frame, text="Investor ID:", font=self.default_font).grid(row=1, column=0, padx=5, pady=5)
+        self.path_investor_id = ctk.CTkEntry(path_frame, width=100, font=self.default_font)
+        self.path_investor_id.grid(row=1, column=1, padx=5, pady=5)
+
+        ctk.CTkLabel(path_frame, text="Startup ID:", font=self.default_font).grid(row=1, column=2, padx=5, pady=5)
+        self.path_startup_id = ctk.CTkEntry(path_frame, width=100, font=self.default_font)
+        self.path_startup_id.grid(row=1, column=3, padx=5, pady=5)
+
+        self.path_btn = ctk.CTkButton(path_frame, text="Find Path", font=self.default_font, command=self.run_shortest_path_query)
+        self.path_btn.grid(row=1, column=4, padx=5, pady=5)
+
+        # --- Results ---
+        self.graph_status_label = ctk.CTkLabel(tab, text="Graph: not loaded", font=ctk.CTkFont(size=14))
+        self.graph_status_label.pack(pady=5)
+
+        self.graph_result_tree = ttk.Treeview(tab, show="headings")
+        self.graph_result_tree.pack(expand=True, fill="both", padx=10, pady=10)
+
+    # --- Graph Loading (background thread, result via graph_queue) ---
+    def load_network_graph(self, on_loaded=None):
+        # on_loaded(graph, error) runs on the main thread once loading has finished
+        if self.graph_loading is not None:
+            if on_loaded:
+                self.graph_loading.append(on_loaded)
+            return
+
+        self.graph_loading = [on_loaded] if on_loaded else []
+        self.graph_pending = []
+        self.graph_status_label.configure(text="Graph: loading...")
+
+        def run():
+            try:
+                conn = mysql.connector.connect(**DB_CONFIG)
+                try:
+                    cursor = conn.cursor()
+                    graph = NetworkGraph()
+                    graph.load(cursor)
+                    cursor.close()
+                finally:
+                    conn.close()
+                self.graph_queue.put((graph, None))
+            except Exception as err:  # Always report back, or the graph would stay "loading"
+                self.graph_queue.put((None, err))
+
+        threading.Thread(target=run, daemon=True).start()
+        self.after(100, self.check_graph_queue)
+
+    def check_graph_queue(self):
+        try:
+            graph, err = self.graph_queue.get_nowait()
+        except queue.Empty:
+            self.after(100, self.check_graph_queue)
+            return
+
+        callbacks, self.graph_loading = self.graph_loading, None
+        pending, self.graph_pending = self.graph_pending, []
+        stale, self.graph_stale = self.graph_stale, False
+        if graph and stale:
+            # Too many rows changed while loading to patch them in, so load a fresh copy
+            self.load_network_graph()
+            self.graph_loading.extend(callbacks)
+            return
+
+        if graph:
+            for table, column_names, row_keys, rows in pending:
+                graph.apply_rows(table, column_names, row_keys, rows)
+            self.network_graph = graph
+            self.graph_status_label.configure(text=f"Graph: loaded with {len(graph.node_kind)} nodes.")
+        else:
+            # Only reported in a dialog to callers waiting for the graph, not for change-feed reloads
+            self.graph_status_label.configure(text=f"Graph: failed to load ({err})")
+        for callback in callbacks:
+            callback(graph, err)
+
+    def with_network_graph(self, query):
+        # Runs query(graph) now if the graph is loaded, otherwise once it has loaded in the background
+        if self.network_graph is not None:
+            query(self.network_graph)
+            return
+
+        def on_loaded(graph, err):
+            if err:
+                messagebox.showerror("Error", f"Failed to load network graph: {err}")
+            else:
+                query(graph)
+
+        self.load_network_graph(on_loaded)
+
+    def rebuild_network_graph(self):
+        self.network_graph = None
+        if self.graph_loading is not None:
+            self.graph_stale = True  # The load in progress may have missed changes
+        else:
+            self.load_network_graph()
+
+    def show_graph_result(self, graph, column_names, rows, started):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.display_rows_in_treeview(self.graph_result_tree, column_names, rows)
+        self.graph_status_label.configure(text=f"Graph: {len(graph.node_kind)} nodes, answered in {elapsed_ms:.1f} ms")
+
+    def run_co_investor_query(self):
+        def query(graph):
+            started = time.perf_counter()
+            rows = graph.top_co_investors()
+            self.show_graph_result(graph, ["Investor A", "Investor B", "SharedStartups"], rows, started)
+
+        self.with_network_graph(query)
+
+    def run_shared_mentors_query(self):
+        def query(graph):
+            started = time.perf_counter()
+            rows = graph.top_shared_mentor_startups()
+            self.show_graph_result(graph, ["Startup A", "Startup B", "SharedMentors"], rows, started)
+
+        self.with_network_graph(query)
+
+    def run_shortest_path_query(self):
+        investor_id = self.path_investor_id.get()
+        startup_id = self.path_startup_id.get()
+
+        if not (investor_id.isdigit() and startup_id.isdigit()):
+            messagebox.showerror("Error", "Please enter a numeric Investor ID and Startup ID.")
+            return
+
+        def query(graph):
+            started = time.perf_counter()
+            path = graph.shortest_path(investor_id, startup_id)
+            if not path:
+                messagebox.showinfo("Shortest Path", "No connection found between this investor and startup.")
+                return
+            self.show_graph_result(graph, ["Step", "Node"], list(enumerate(path)), started)
+
+        self.with_network_graph(query)
+
+    # ===================================================================
+    # TAB 6: PORTFOLIO REPORTS (Batch HTML Reports)
+    # ===================================================================
+    def create_tab_6_reports(self):
+        tab = self.tab_view.tab("Portfolio Reports")
+
+        report_frame = ctk.CTkFrame(tab)
+        report_frame.pack(fill="x", padx=10, pady=10)
+
+        ctk.CTkLabel(report_frame, text="Generate One Report per Startup (HTML)", font=ctk.CTkFont(weight="bold")).grid(row=0, column=0, columnspan=4, pady=5)
+
+        ctk.CTkLabel(report_frame, text="Output Folder:", font=self.default_font).grid(row=1, column=0, padx=5, pady=5)
+        self.report_dir_entry = ctk.CTkEntry(report_frame, width=300, font=self.default_font)
+        self.report_dir_entry.insert(0, "reports")
+        self.report_dir_entry.grid(row=1, column=1, columnspan=3, padx=5, pady=5, sticky="w")
+
+        self.report_changed_btn = ctk.CTkButton(report_frame, text="Generate Changed Reports", font=self.default_font, command=lambda: self.start_report_generation(only_changed=True))
+        self.report_changed_btn.grid(row=2, column=0, columnspan=2, padx=5, pady=10)
+
+        self.report_all_btn = ctk.CTkButton(report_frame, text="Regenerate All", font=self.default_font, fg_color="grey", command=lambda: self.start_report_generation(only_changed=False))
+        self.report_all_btn.grid(row=2, column=2, columnspan=2, padx=5, pady=10)
+
+        self.report_progress = ctk.CTkProgressBar(tab, width=600)
+        self.report_progress.set(0)
+        self.report_progress.pack(pady=10)
+
+        self.report_status_label = ctk.CTkLabel(tab, text="Status: idle", font=ctk.CTkFont(size=14))
+        self.report_status_label.pack(pady=5)
+
+        self.report_queue = queue.Queue()  # Messages from the background thread to the GUI
+
+    def start_report_generation(self, only_changed):
+        output_dir = self.report_dir_entry.get()
+        if not output_dir:
+            messagebox.showerror("Error", "Please enter an output folder.")
+            return
+
+        self.report_changed_btn.configure(state="disabled")
+        self.report_all_btn.configure(state="disabled")
+        self.report_progress.set(0)
+        self.report_status_label.configure(text="Status: fetching data...")
+
+        # Tkinter widgets may only be touched from the main thread, so the worker
+        # thread reports through a queue that check_report_queue() drains.
+        def run():
+            try:
+                result = generate_reports(DB_CONFIG, output_dir, only_changed=only_changed,
+                                          progress=lambda done, total: self.report_queue.put(("progress", done, total)))
+                self.report_queue.put(("done", result))
+            except Exception as err:  # Any failure (DB, files, worker processes) must re-enable the buttons
+                self.report_queue.put(("error", err))
+
+        threading.Thread(target=run, daemon=True).start()
+        self.after(100, self.check_report_queue)
+
+    def check_report_queue(self):
+        while True:
+            try:
+                message = self.report_queue.get_nowait()
+            except queue.Empty:
+                self.after(100, self.check_report_queue)
+                return
+
+            if message[0] == "progress":
+                done, total = message[1], message[2]
+                self.report_progress.set(done / total if total else 1)
+                self.report_status_label.configure(text=f"Status: rendered {done} of {total} reports...")
+                continue
+
+            self.report_changed_btn.configure(state="normal")
+            self.report_all_btn.configure(state="normal")
+            if message[0] == "done":
+                generated, unchanged, removed = message[1]
+                self.report_progress.set(1)
+                self.report_status_label.configure(text=f"Status: {generated} generated, {unchanged} unchanged, {removed} removed.")
+            else:
+                self.report_status_label.configure(text="Status: failed.")
+                messagebox.showerror("Error", f"Failed to generate reports: {message[1]}")
+            return
+
+    # ===================================================================
+    # TAB 7: DUPLICATE DETECTION (Founders, Mentors, Investors)
+    # ===================================================================
+    def create_tab_7_duplicates(self):
+        tab = self.tab_view.tab("Duplicate Detection")
+
+        scan_frame = ctk.CTkFrame(tab)
+        scan_frame.pack(fill="x", padx=10, pady=10)
+
+        ctk.CTkLabel(scan_frame, text="Find Likely Duplicates", font=ctk.CTkFont(weight="bold")).grid(row=0, column=0, columnspan=5, pady=5)
+
+        ctk.CTkLabel(scan_frame, text="Table:", font=self.default_font).grid(row=1, column=0, padx=5, pady=5)
+        self.dup_entity_menu = ctk.CTkOptionMenu(scan_frame, values=["founders", "mentors", "investors"], font=self.default_font)
+        self.dup_entity_menu.grid(row=1, column=1, padx=5, pady=5)
+
+        ctk.CTkLabel(scan_frame, text="Min. Similarity (0-1):", font=self.default_font).grid(row=1, column=2, padx=5, pady=5)
+        self.dup_threshold_entry = ctk.CTkEntry(scan_frame, width=100, font=self.default_font)
+        self.dup_threshold_entry.insert(0, str(DEFAULT_THRESHOLD))
+        self.dup_threshold_entry.grid(row=1, column=3, padx=5, pady=5)
+
+        self.dup_scan_btn = ctk.CTkButton(scan_frame, text="Scan for Duplicates", font=self.default_font, command=self.run_duplicate_scan)
+        self.dup_scan_btn.grid(row=1, column=4, padx=5, pady=5)
+
+        self.dup_status_label = ctk.CTkLabel(tab, text="", font=ctk.CTkFont(size=14))
+        self.dup_status_label.pack(pady=5)
+
+        self.dup_result_tree = ttk.Treeview(tab, show="headings")
+        self.dup_result_tree.pack(expand=True, fill="both", padx=10, pady=10)
+
+    # --- Duplicate Index Loading (background thread, results via dedup_queue) ---
+    def load_dedup_index(self, entity, on_loaded=None):
+        # on_loaded(index, error) runs on the main thread once loading has finished
+        if entity in self.dedup_loading:
+            if on_loaded:
+                self.dedup_loading[entity].append(on_loaded)
+            return
+
+        self.dedup_loading[entity] = [on_loaded] if on_loaded else []
+        self.dedup_failed.pop(entity, None)
+
+        def run():
+            try:
+                conn = mysql.connector.connect(**DB_CONFIG)
+                try:
+                    cursor = conn.cursor()
+                    index = DedupIndex()
+                    index.load(cursor, entity)
+                    cursor.close()
+                finally:
+                    conn.close()
+                self.dedup_queue.put(("loaded", entity, index, None))
+            except Exception as err:  # Always report back, or the entity would stay "loading"
+                self.dedup_queue.put(("loaded", entity, None, err))
+
+        threading.Thread(target=run, daemon=True).start()
+        self.schedule_dedup_poll()
+
+    def schedule_dedup_poll(self):
+        if not self.dedup_polling:
+            self.dedup_polling = True
+            self.after(100, self.check_dedup_queue)
+
+    def check_dedup_queue(self):
+        self.dedup_polling = False
+        while True:
+            try:
+                message = self.dedup_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if message[0] == "loaded":
+                _, entity, index, err = message
+                callbacks = self.dedup_loading.pop(entity, [])
+                pending = self.dedup_pending.pop(entity, [])
+                if index:
+                    for apply_update in pending:
+                        apply_update(index)
+                    self.dedup_indexes[entity] = index
+                else:
+                    self.dedup_failed[entity] = err
+                for callback in callbacks:
+                    callback(index, err)
+            else:  # "scanned"
+                self.finish_duplicate_scan(*message[1:])
+
+        if self.dedup_loading or self.dup_scan_index is not None:
+            self.schedule_dedup_poll()
+
+    def get_dedup_index(self, entity):
+        # Returns the index if it is ready. Otherwise starts loading it in the background
+        # (unless the last attempt failed) and returns None, so callers never block the GUI.
+        if entity not in self.dedup_indexes and entity not in self.dedup_failed:
+            self.load_dedup_index(entity)
+        return self.dedup_indexes.get(entity)
+
+    def run_duplicate_scan(self):
+        entity = self.dup_entity_menu.get()
+        try:
+            threshold = float(self.dup_threshold_entry.get())
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a similarity between 0 and 1.")
+            return
+
+        self.dup_scan_btn.configure(state="disabled")
+        self.dup_status_label.configure(text=f"Loading {entity}...")
+        started = time.perf_counter()
+        self.dedup_indexes.pop(entity, None)  # Always scan fresh data (this also retries after a failure)
+        self.dedup_failed.pop(entity, None)
+        self.load_dedup_index(entity, on_loaded=lambda index, err: self.start_duplicate_comparison(entity, threshold, started, index, err))
+
+    def start_duplicate_comparison(self, entity, threshold, started, index, err):
+        if err:
+            self.dup_scan_btn.configure(state="normal")
+            self.dup_status_label.configure(text="")
+            messagebox.showerror("Error", f"Failed to load {entity}: {err}")
+            return
+
+        loaded = time.perf_counter()
+        self.dup_status_label.configure(text=f"Comparing {len(index.records)} {entity}...")
+
+        def run():
+            try:
+                matches = index.find_duplicates(threshold)
+                self.dedup_queue.put(("scanned", entity, index, matches, started, loaded, None))
+            except Exception as scan_err:
+                self.dedup_queue.put(("scanned", entity, index, None, started, loaded, scan_err))
+
+        self.dup_scan_index = index
+        threading.Thread(target=run, daemon=True).start()
+        self.schedule_dedup_poll()
+
+    def finish_duplicate_scan(self, entity, index, matches, started, loaded, err):
+        finished = time.perf_counter()
+        if not err:
+            # Names are looked up before the buffered updates can remove any of these records
+            rows = [(f"{score:.0%}", id_a, index.name_of(id_a), id_b, index.name_of(id_b)) for score, id_a, id_b in matches]
+        self.dup_scan_index = None
+        pending, self.dup_scan_pending = self.dup_scan_pending, []
+        for column_names, row_keys, changed_rows in pending:
+            index.apply_rows(column_names, row_keys, changed_rows)
+
+        self.dup_scan_btn.configure(state="normal")
+        if err:
+            self.dup_status_label.configure(text="")
+            messagebox.showerror("Error", f"Failed to compare {entity}: {err}")
+            return
+
+        self.display_rows_in_treeview(self.dup_result_tree, ["Similarity", "ID A", "Name A", "ID B", "Name B"], rows)
+        self.dup_status_label.configure(text=f"{len(matches)} likely duplicates among {len(index.records)} {entity} "
+                                             f"(loaded in {loaded - started:.2f} s, compared in {finished - loaded:.2f} s)")
+
+    # --- Live Duplicate Check While Typing ---
+    def watch_for_duplicates(self, entity, label, name_entry, email_entry=None):
+        def on_key(event):
+            if label in self.dup_check_jobs:
+                self.after_cancel(self.dup_check_jobs[label])
+            self.dup_check_jobs[label] = self.after(DUP_CHECK_DELAY_MS, lambda: self.show_duplicate_warning(entity, label, name_entry, email_entry))
+
+        name_entry.bind("<KeyRelease>", on_key)
+        if email_entry:
+            email_entry.bind("<KeyRelease>", on_key)
+
+    def show_duplicate_warning(self, entity, label, name_entry, email_entry):
+        self.dup_check_jobs.pop(label, None)
+        name = name_entry.get().strip()
+        email = email_entry.get().strip() if email_entry else None
+
+        if len(name) < 3:
+            label.configure(text="")
+            return
+
+        index = self.get_dedup_index(entity)
+        if not index:
+            if entity in self.dedup_failed:
+                # Reported once here; loading is not retried on every keystroke
+                label.configure(text=f"Duplicate check unavailable: {self.dedup_failed[entity]}")
+            else:
+                label.configure(text="Loading existing records for the duplicate check...")
+                self.load_dedup_index(entity, on_loaded=lambda index, err: self.show_duplicate_warning(entity, label, name_entry, email_entry))
+            return
+        matches = index.check(name, email)
+        if matches:
+            similar = ", ".join(f"{index.name_of(record_id)} (ID {record_id}, {score:.0%})" for score, record_id in matches[:3])
+            label.configure(text=f"Possible duplicate of: {similar}")
+        else:
+            label.configure(text="")
+
+    def confirm_not_duplicate(self, entity, name, email=None):
+        index = self.get_dedup_index(entity)
+        if not index:
+            return True  # Still loading or unavailable: do not hold up the insert
+        matches = [(score, record_id) for score, record_id in index.check(name, email) if score >= STRONG_DUP_SCORE]
+        if not matches:
+            return True
+        similar = "\n".join(f"- {index.name_of(record_id)} (ID {record_id}, {score:.0%} similar)" for score, record_id in matches)
+        return messagebox.askyesno("Possible Duplicate", f"This looks like an existing {entity[:-1]}:\n{similar}\n\nAdd it anyway?")
+
 
 # --- Run the Application ---
 if __name__ == "__main__":
@@ -0,0 +1,113 @@
+# change_feed.py
+# Polls the 'table_versions' / 'change_log' tables (maintained by triggers, see 'sql code.txt')
+# so that several running copies of app.py can see each other's changes.
+import mysql.connector
+
+# Primary key column(s) of every tracked table.
+# For composite keys the change log stores the values joined with '-'.
+TABLE_KEYS = {
+    "startups": ("startup_id",),
+    "founders": ("founder_id",),
+    "mentors": ("mentor_id",),
+    "investors": ("investor_id",),
+    "funding": ("funding_id",),
+    "startup_mentors": ("startup_id", "mentor_id"),
+}
+
+# Child tables whose rows change without firing triggers when a parent row is deleted
+# (ON DELETE CASCADE / ON DELETE SET NULL). Format: parent -> [(child_table, fk_column), ...]
+CASCADE_CHILDREN = {
+    "startups": [("founders", "startup_id"), ("funding", "startup_id"), ("startup_mentors", "startup_id")],
+    "mentors": [("startup_mentors", "mentor_id")],
+    "investors": [("funding", "investor_id")],
+}
+
+
+def make_row_key(values):
+    return "-".join(str(v) for v in values)
+
+
+class ChangeFeed:
+    def __init__(self, db_config):
+        self.db_config = db_config
+        self.conn = None
+        self.versions = None  # {table_name: version} as of the last poll
+
+    # --- Connection Helper (one long-lived, autocommit connection) ---
+    def _cursor(self):
+        if self.conn is None or not self.conn.is_connected():
+            self.conn = mysql.connector.connect(**self.db_config)
+            # Autocommit so every poll sees a fresh snapshot instead of the
+            # REPEATABLE READ view of one long transaction.
+            self.conn.autocommit = True
+        return self.conn.cursor()
+
+    def close(self):
+        if self.conn is not None and self.conn.is_connected():
+            self.conn.close()
+        self.conn = None
+
+    # --- Polling ---
+    def poll(self):
+        # Returns ({table_name: [(row_key, op), ...]}, versions) for every table that changed
+        # since the versions last passed to advance(), with one entry per row (the latest op wins).
+        # Before the first advance() there is nothing to compare with, so no changes are returned.
+        cursor = self._cursor()
+        try:
+            cursor.execute("SELECT table_name, version FROM table_versions")
+            current = dict(cursor.fetchall())
+
+            if self.versions is None:
+                return {}, current
+
+            changes = {}
+            for table, version in current.items():
+                last_seen = self.versions.get(table, 0)
+                if version <= last_seen:
+                    current[table] = last_seen  # Never move backwards
+                    continue
+
+                cursor.execute(
+                    "SELECT row_key, op FROM change_log "
+                    "WHERE table_name = %s AND change_id > %s AND change_id <= %s "
+                    "ORDER BY change_id",
+                    (table, last_seen, version))
+
+                latest_op = {}
+                for row_key, op in cursor.fetchall():
+                    latest_op.pop(row_key, None)  # Keep rows in order of their last change
+                    latest_op[row_key] = op
+                changes[table] = list(latest_op.items())
+
+            return changes, current
+        finally:
+            cursor.close()
+
+    def advance(self, versions):
+        # Call once the changes returned together with 'versions' have been applied; until then
+        # poll() keeps returning them, so a failure part way through never loses a change.
+        self.versions = versions
+
+    def fetch_rows(self, table, row_keys):
+        # Returns (column_names, {row_key: row}) for the given keys.
+        # Keys missing from the result no longer exist in the table.
+        key_columns = TABLE_KEYS[table]
+        cursor = self._cursor()
+        try:
+            if not row_keys:
+                cursor.execute(f"SELECT * FROM {table} LIMIT 0")
+                cursor.fetchall()
+                return [desc[0] for desc in cursor.description], {}
+
+            key_values = [str(k).split("-") for k in row_keys]
+            placeholders = ", ".join(["(" + ", ".join(["%s"] * len(key_columns)) + ")"] * len(key_values))
+            query = f"SELECT * FROM {table} WHERE ({', '.join(key_columns)}) IN ({placeholders})"
+            cursor.execute(query, [v for values in key_values for v in values])
+            rows = cursor.fetchall()
+
+            column_names = [desc[0] for desc in cursor.description]
+            key_indexes = [column_names.index(col) for col in key_columns]
+            found = {make_row_key(row[i] for i in key_indexes): row for row in rows}
+            return column_names, found
+        finally:
+            cursor.close()
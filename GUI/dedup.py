@@ -0,0 +1,235 @@
+# dedup.py
+# Near-duplicate detection for founders, mentors and investors.
+#
+# Records are grouped into blocks by cheap keys (normalized names, phonetic codes,
+# email local parts) and only records sharing a block are compared, so the work grows
+# with the block sizes instead of n^2.
+import difflib
+import gc
+import re
+import unicodedata
+from functools import lru_cache
+
+# Entity -> query returning (id, name, email, startup_id)
+ENTITY_QUERIES = {
+    "founders": "SELECT founder_id, name, email, startup_id FROM founders",
+    "mentors": "SELECT mentor_id, name, NULL, NULL FROM mentors",
+    "investors": "SELECT investor_id, name, NULL, NULL FROM investors",
+}
+
+# Words that do not distinguish one organization from another
+STOP_WORDS = {"pvt", "private", "ltd", "limited", "inc", "llc", "llp", "co", "corp",
+              "corporation", "company", "the", "and", "of"}
+
+DEFAULT_THRESHOLD = 0.85
+MAX_BLOCK_SIZE = 500  # Larger blocks (very common keys) are skipped in full scans
+
+SOUNDEX_CODES = {}
+for letters, code in (("bfpv", "1"), ("cgjkqsxz", "2"), ("dt", "3"), ("l", "4"), ("mn", "5"), ("r", "6")):
+    for letter in letters:
+        SOUNDEX_CODES[letter] = code
+
+
+# ===================================================================
+# Normalization & Blocking Keys
+# ===================================================================
+def normalize_tokens(name):
+    # 'Sequoia Capital (India) Pvt. Ltd.' -> ('sequoia', 'capital', 'india')
+    text = name or ""
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    text = text.lower()
+    return tuple(t for t in re.split(r"[^a-z0-9]+", text) if t and t not in STOP_WORDS)
+
+
+@lru_cache(maxsize=1 << 16)  # Name tokens repeat a lot across records
+def soundex(word):
+    word = "".join(c for c in word.lower() if c.isalpha())
+    if not word:
+        return ""
+    code = word[0].upper()
+    last = SOUNDEX_CODES.get(word[0], "")
+    for c in word[1:]:
+        digit = SOUNDEX_CODES.get(c, "")
+        if digit and digit != last:
+            code += digit
+            if len(code) == 4:
+                break
+        if c not in "hw":
+            last = digit
+    return code.ljust(4, "0")
+
+
+def email_local_part(email):
+    # 'Arjun.Mehta+work@gmail.com' -> 'arjunmehta'. Digits are kept: 'john1' and 'john2'
+    # are different mailboxes, usually of different people.
+    local = (email or "").lower().split("@")[0].split("+")[0]
+    return re.sub(r"[._-]", "", local)
+
+
+def blocking_keys(tokens, email_local):
+    keys = []
+    if tokens:
+        keys.append("n:" + " ".join(sorted(tokens)))                       # same words, any order
+        if len(tokens) > 1:
+            keys.append("h:" + tokens[0] + "|" + soundex(tokens[1]))       # 'Sequoia Capital ...'
+            keys.append("p:" + soundex(tokens[0]) + soundex(tokens[-1]))   # sounds alike
+        else:
+            keys.append("h:" + tokens[0])
+    if len(email_local) >= 4:
+        keys.append("e:" + email_local)
+    return keys
+
+
+def similarity(tokens_a, email_a, tokens_b, email_b, threshold=0.0):
+    # 0..1; containment catches 'Sequoia Capital' vs 'Sequoia Capital India'.
+    # Character similarity is only computed when it could lift the score to the threshold.
+    if email_a and email_a == email_b and len(email_a) >= 4:
+        return 0.95
+    set_a, set_b = set(tokens_a), set(tokens_b)
+    if not set_a or not set_b:
+        return 0.0
+    common = len(set_a & set_b)
+    score = max(common / len(set_a | set_b), 0.9 * common / min(len(set_a), len(set_b)))
+
+    if score >= threshold and threshold:
+        return score
+
+    # Character-level similarity for spelling variants, checked against cheap upper bounds first
+    text_a, text_b = " ".join(tokens_a), " ".join(tokens_b)
+    bound = max(score, threshold)
+    if 2 * min(len(text_a), len(text_b)) / (len(text_a) + len(text_b)) <= bound:
+        return score
+    matcher = difflib.SequenceMatcher(None, text_a, text_b)
+    if matcher.quick_ratio() > bound:
+        score = max(score, matcher.ratio())
+    return score
+
+
+# ===================================================================
+# Index
+# ===================================================================
+class DedupIndex:
+    def __init__(self, max_block_size=MAX_BLOCK_SIZE):
+        self.max_block_size = max_block_size
+        self.records = {}  # record_id -> (name, tokens, email_local, keys)
+        self.blocks = {}   # key -> list of record_ids
+        self.first_token_blocks = {}  # first name token -> list of record_ids (only used by check)
+        self.startup_ids = {}  # record_id -> startup_id, for founders deleted with their startup
+
+    def load(self, cursor, entity):
+        cursor.execute(ENTITY_QUERIES[entity])
+        rows = cursor.fetchall()
+
+        # Bulk loading creates millions of small objects and none of them are garbage;
+        # pausing the cyclic GC meanwhile roughly halves the load time.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for record_id, name, email, startup_id in rows:
+                self.add(record_id, name, email, startup_id)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def add(self, record_id, name, email=None, startup_id=None):
+        if record_id in self.records:
+            self.remove(record_id)
+        tokens = normalize_tokens(name)
+        email_local = email_local_part(email)
+        keys = blocking_keys(tokens, email_local)
+        self.records[record_id] = (name, tokens, email_local, keys)
+        if startup_id is not None:
+            self.startup_ids[record_id] = startup_id
+
+        # Most blocks hold a single record, so plain lists are used instead of sets
+        if tokens:
+            keys = keys + [None]
+        for key in keys:
+            blocks = self.blocks if key is not None else self.first_token_blocks
+            key = key if key is not None else tokens[0]
+            block = blocks.get(key)
+            if block is None:
+                blocks[key] = [record_id]
+            else:
+                block.append(record_id)
+
+    def remove(self, record_id):
+        record = self.records.pop(record_id, None)
+        if record is None:
+            return
+        self.startup_ids.pop(record_id, None)
+        block_refs = [(self.blocks, key) for key in record[3]]
+        if record[1]:
+            block_refs.append((self.first_token_blocks, record[1][0]))
+        for blocks, key in block_refs:
+            block = blocks.get(key)
+            if block is not None and record_id in block:
+                block.remove(record_id)
+                if not block:
+                    del blocks[key]
+
+    def apply_rows(self, column_names, row_keys, rows):
+        # Applies change-feed results: rows[key] is the current row, missing if it was deleted
+        for key in row_keys:
+            row = rows.get(key)
+            if row is None:
+                self.remove(int(key))
+            else:
+                values = dict(zip(column_names, row))
+                self.add(int(key), values["name"], values.get("email"), values.get("startup_id"))
+
+    def records_of_startups(self, startup_ids):
+        # Records (founders) belonging to any of the given startups
+        return [record_id for record_id, startup_id in self.startup_ids.items() if startup_id in startup_ids]
+
+    def remove_startups(self, startup_ids):
+        # ON DELETE CASCADE removes a startup's founders without firing their triggers
+        for record_id in self.records_of_startups(startup_ids):
+            self.remove(record_id)
+
+    def name_of(self, record_id):
+        return self.records[record_id][0]
+
+    def find_duplicates(self, threshold=DEFAULT_THRESHOLD):
+        # Returns [(score, id_a, id_b), ...] for every likely duplicate pair, best first
+        matches = []
+        for key, block in self.blocks.items():
+            if len(block) < 2 or len(block) > self.max_block_size:
+                continue
+            ids = sorted(block)
+            for i, id_a in enumerate(ids):
+                _, tokens_a, email_a, keys_a = self.records[id_a]
+                for id_b in ids[i + 1:]:
+                    _, tokens_b, email_b, keys_b = self.records[id_b]
+                    # A pair sharing several blocks is only scored in the first of them that
+                    # is not skipped as oversized (this block qualifies, so there is one)
+                    if next(k for k in keys_a if k in keys_b and len(self.blocks[k]) <= self.max_block_size) != key:
+                        continue
+                    score = similarity(tokens_a, email_a, tokens_b, email_b, threshold)
+                    if score >= threshold:
+                        matches.append((score, id_a, id_b))
+        matches.sort(key=lambda m: -m[0])
+        return matches
+
+    def check(self, name, email=None, threshold=DEFAULT_THRESHOLD, limit=5):
+        # Likely duplicates of a record that is being typed: [(score, record_id), ...]
+        tokens = normalize_tokens(name)
+        email_local = email_local_part(email)
+        candidates = set()
+        for key in blocking_keys(tokens, email_local):
+            candidates.update(self.blocks.get(key, ()))
+        # While a name is still being typed, its first word is often all there is to go on
+        if tokens:
+            first_token_block = self.first_token_blocks.get(tokens[0], ())
+            if len(first_token_block) <= self.max_block_size:
+                candidates.update(first_token_block)
+
+        matches = []
+        for record_id in candidates:
+            _, other_tokens, other_email, _ = self.records[record_id]
+            score = similarity(tokens, email_local, other_tokens, other_email, threshold)
+            if score >= threshold:
+                matches.append((score, record_id))
+        matches.sort(key=lambda m: -m[0])
+        return matches[:limit]
@@ -0,0 +1,376 @@
+# load_simulator.py
+# Headless load generator: replays the GUI workflows from N concurrent workers against
+# the database in db_config.py and reports throughput, latency percentiles, deadlocks
+# and lock-wait time per operation.
+#
+# Usage: python load_simulator.py --workers 32 --duration 60
+#
+# All rows it creates use the 'LoadSim-' name prefix and are deleted at the end
+# (unless --keep-data is given). Existing data is only read, never modified.
+import argparse
+import random
+import threading
+import time
+import uuid
+
+import mysql.connector
+from db_config import DB_CONFIG
+
+SIM_PREFIX = "LoadSim-"
+
+# MySQL error codes counted separately in the report
+ER_LOCK_DEADLOCK = 1213
+ER_LOCK_WAIT_TIMEOUT = 1205
+# Client errors meaning the connection is gone (server gone away, lost during query, lost)
+LOST_CONNECTION_ERRORS = (2006, 2013, 2055)
+RECONNECT_DELAY = 0.5  # seconds between reconnect attempts
+
+# Default operation mix (relative weights)
+DEFAULT_MIX = {
+    "add_startup": 3,
+    "assign_mentor": 3,
+    "update_funding": 5,
+    "delete_startup": 1,
+}
+
+# Per-thread cumulative lock time (picoseconds), including InnoDB row lock waits on MySQL 8.0.28+
+LOCK_TIME_QUERY = """
+SELECT COALESCE(SUM(SUM_LOCK_TIME), 0)
+FROM performance_schema.events_statements_summary_by_thread_by_event_name
+WHERE THREAD_ID = PS_CURRENT_THREAD_ID()
+"""
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class OpStats:
+    def __init__(self):
+        self.latencies = []  # seconds, successful and failed attempts
+        self.errors = 0
+        self.deadlocks = 0
+        self.lock_wait_timeouts = 0
+        self.lock_wait = 0.0  # seconds
+
+    def merge(self, other):
+        self.latencies.extend(other.latencies)
+        self.errors += other.errors
+        self.deadlocks += other.deadlocks
+        self.lock_wait_timeouts += other.lock_wait_timeouts
+        self.lock_wait += other.lock_wait
+
+
+class SharedState:
+    # Ids shared between workers, so they contend on the same rows like real coordinators do
+    def __init__(self, startup_ids, mentor_ids, funding_ids, investor_ids):
+        self.lock = threading.Lock()
+        self.startup_ids = list(startup_ids)
+        self.mentor_ids = list(mentor_ids)
+        self.funding_ids = list(funding_ids)
+        self.investor_ids = list(investor_ids)
+
+    def pick(self, name):
+        with self.lock:
+            ids = getattr(self, name)
+            return random.choice(ids) if ids else None
+
+    def add(self, name, value):
+        with self.lock:
+            getattr(self, name).append(value)
+
+    def take_startup(self):
+        # Removes a startup from the pool so two workers do not delete the same one
+        with self.lock:
+            if len(self.startup_ids) <= 1:
+                return None
+            return self.startup_ids.pop(random.randrange(len(self.startup_ids)))
+
+    def forget_startup(self, startup_id):
+        with self.lock:
+            self.funding_ids = [f for f in self.funding_ids if f[1] != startup_id]
+
+
+# ===================================================================
+# Workflows (the same statements the GUI runs)
+# ===================================================================
+def op_add_startup(cursor, state):
+    # Procedure: sp_AddNewStartupAndFounder, then a first funding round for the new startup
+    tag = uuid.uuid4().hex[:12]
+    name = f"{SIM_PREFIX}{tag}"
+    cursor.callproc('sp_AddNewStartupAndFounder',
+                    (name, "Simulated", "Idea", f"Founder {tag}", f"{tag}@gmail.com", "9" + tag[:9].translate(str.maketrans("abcdef", "123456"))))
+    for result in cursor.stored_results():
+        result.fetchall()
+    cursor.execute("SELECT startup_id FROM startups WHERE name = %s", (name,))
+    startup_id = cursor.fetchone()[0]
+
+    investor_id = state.pick("investor_ids")
+    cursor.execute("INSERT INTO funding (startup_id, investor_id, amount, date) VALUES (%s, %s, %s, CURDATE())",
+                   (startup_id, investor_id, random.randint(1, 100) * 10000))
+    return startup_id, cursor.lastrowid
+
+
+def op_assign_mentor(cursor, state):
+    # Procedure: sp_AssignMentorToStartup
+    startup_id = state.pick("startup_ids")
+    mentor_id = state.pick("mentor_ids")
+    if startup_id is None or mentor_id is None:
+        return None
+    cursor.callproc('sp_AssignMentorToStartup', (startup_id, mentor_id))
+    for result in cursor.stored_results():
+        result.fetchall()
+
+
+def op_update_funding(cursor, state):
+    # Fires the funding audit trigger
+    funding = state.pick("funding_ids")
+    if funding is None:
+        return None
+    cursor.execute("UPDATE funding SET amount = %s WHERE funding_id = %s",
+                   (random.randint(1, 100) * 10000, funding[0]))
+
+
+def op_delete_startup(cursor, state):
+    # ON DELETE CASCADE removes founders, funding and mentor assignments
+    startup_id = state.take_startup()
+    if startup_id is None:
+        return None
+    cursor.execute("DELETE FROM startups WHERE startup_id = %s AND name LIKE %s", (startup_id, SIM_PREFIX + "%"))
+    return startup_id
+
+
+OPERATIONS = {
+    "add_startup": op_add_startup,
+    "assign_mentor": op_assign_mentor,
+    "update_funding": op_update_funding,
+    "delete_startup": op_delete_startup,
+}
+
+
+# ===================================================================
+# Workers
+# ===================================================================
+class Worker(threading.Thread):
+    def __init__(self, state, mix, deadline, max_ops, measure_locks):
+        super().__init__(daemon=True)
+        self.state = state
+        self.ops = list(mix)
+        self.weights = [mix[op] for op in self.ops]
+        self.deadline = deadline
+        self.max_ops = max_ops
+        self.measure_locks = measure_locks
+        self.stats = {op: OpStats() for op in self.ops}
+        self.fatal_error = None
+
+    def read_lock_time(self, cursor):
+        cursor.execute(LOCK_TIME_QUERY)
+        return float(cursor.fetchone()[0]) / 1e12
+
+    def run(self):
+        try:
+            conn = mysql.connector.connect(**DB_CONFIG)
+        except mysql.connector.Error as err:
+            self.fatal_error = err
+            return
+
+        cursor = conn.cursor()
+        done = 0
+        connection_lost = False
+        try:
+            while time.monotonic() < self.deadline and (not self.max_ops or done < self.max_ops):
+                if connection_lost:
+                    try:
+                        conn.reconnect(attempts=1)
+                        cursor = conn.cursor()
+                        connection_lost = False
+                    except mysql.connector.Error:
+                        time.sleep(RECONNECT_DELAY)
+                        continue
+
+                op = random.choices(self.ops, self.weights)[0]
+                stats = self.stats[op]
+
+                lock_before = None
+                if self.measure_locks:
+                    try:
+                        lock_before = self.read_lock_time(cursor)
+                    except mysql.connector.Error as err:
+                        if err.errno in LOST_CONNECTION_ERRORS:
+                            connection_lost = True
+                            stats.errors += 1
+                            continue
+                        self.measure_locks = False  # performance_schema not available
+
+                start = time.perf_counter()
+                failed = False
+                try:
+                    result = OPERATIONS[op](cursor, self.state)
+                    conn.commit()
+                    if op == "add_startup":
+                        self.state.add("startup_ids", result[0])
+                        self.state.add("funding_ids", (result[1], result[0]))
+                    elif op == "delete_startup" and result is not None:
+                        self.state.forget_startup(result)
+                except mysql.connector.Error as err:
+                    failed = True
+                    stats.errors += 1
+                    if err.errno == ER_LOCK_DEADLOCK:
+                        stats.deadlocks += 1
+                    elif err.errno == ER_LOCK_WAIT_TIMEOUT:
+                        stats.lock_wait_timeouts += 1
+                    elif err.errno in LOST_CONNECTION_ERRORS:
+                        connection_lost = True
+                    if not connection_lost:
+                        try:
+                            conn.rollback()
+                        except mysql.connector.Error:
+                            connection_lost = True
+                stats.latencies.append(time.perf_counter() - start)
+
+                if lock_before is not None and not connection_lost:
+                    try:
+                        stats.lock_wait += self.read_lock_time(cursor) - lock_before
+                    except mysql.connector.Error:
+                        connection_lost = True
+                        if not failed:
+                            stats.errors += 1
+                done += 1
+        finally:
+            try:
+                cursor.close()
+                conn.close()
+            except mysql.connector.Error:
+                pass  # Connection already gone
+
+
+# ===================================================================
+# Setup, Cleanup and Report
+# ===================================================================
+def load_state(conn, seed_startups):
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT mentor_id FROM mentors")
+        mentor_ids = [row[0] for row in cursor.fetchall()]
+        cursor.execute("SELECT investor_id FROM investors")
+        investor_ids = [row[0] for row in cursor.fetchall()]
+        state = SharedState([], mentor_ids, [], investor_ids)
+
+        # Seed startups owned by the simulator, so updates and deletes never touch real data
+        for _ in range(seed_startups):
+            startup_id, funding_id = op_add_startup(cursor, state)
+            state.add("startup_ids", startup_id)
+            state.add("funding_ids", (funding_id, startup_id))
+        conn.commit()
+        return state
+    finally:
+        cursor.close()
+
+
+def cleanup(conn):
+    cursor = conn.cursor()
+    try:
+        cursor.execute("DELETE FROM startups WHERE name LIKE %s", (SIM_PREFIX + "%",))
+        conn.commit()
+        return cursor.rowcount
+    finally:
+        cursor.close()
+
+
+def read_innodb_row_locks(conn):
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SHOW GLOBAL STATUS WHERE Variable_name IN ('Innodb_row_lock_waits', 'Innodb_row_lock_time')")
+        return {name: int(value) for name, value in cursor.fetchall()}
+    finally:
+        cursor.close()
+
+
+def print_report(totals, elapsed, workers, lock_before, lock_after):
+    print(f"\nWorkers: {workers}   Elapsed: {elapsed:.1f} s")
+    header = f"{'Operation':<16}{'Ops':>8}{'Ops/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}" \
+             f"{'Errors':>8}{'Deadlk':>8}{'LockTO':>8}{'LockWait ms':>13}"
+    print(header)
+    print("-" * len(header))
+
+    all_ops = OpStats()
+    for op, stats in totals.items():
+        all_ops.merge(stats)
+        print_row(op, stats, elapsed)
+    print("-" * len(header))
+    print_row("TOTAL", all_ops, elapsed)
+
+    if lock_before and lock_after:
+        waits = lock_after.get("Innodb_row_lock_waits", 0) - lock_before.get("Innodb_row_lock_waits", 0)
+        wait_ms = lock_after.get("Innodb_row_lock_time", 0) - lock_before.get("Innodb_row_lock_time", 0)
+        print(f"\nInnoDB row lock waits (server-wide): {waits}, total wait {wait_ms} ms")
+
+
+def print_row(name, stats, elapsed):
+    latencies = sorted(stats.latencies)
+    ms = [percentile(latencies, p) * 1000 for p in (50, 95, 99, 100)]
+    print(f"{name:<16}{len(latencies):>8}{len(latencies) / elapsed:>9.1f}"
+          f"{ms[0]:>9.1f}{ms[1]:>9.1f}{ms[2]:>9.1f}{ms[3]:>9.1f}"
+          f"{stats.errors:>8}{stats.deadlocks:>8}{stats.lock_wait_timeouts:>8}{stats.lock_wait * 1000:>13.1f}")
+
+
+def parse_mix(text):
+    # e.g. "add_startup=3,assign_mentor=3,update_funding=5,delete_startup=1"
+    mix = {}
+    for part in text.split(","):
+        op, _, weight = part.partition("=")
+        op = op.strip()
+        if op not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"Unknown operation '{op}'. Choose from: {', '.join(OPERATIONS)}")
+        mix[op] = float(weight or 1)
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent workload simulator for the incubator database.")
+    parser.add_argument("--workers", type=int, default=16, help="number of concurrent workers (connections)")
+    parser.add_argument("--duration", type=float, default=30, help="seconds to run")
+    parser.add_argument("--ops-per-worker", type=int, default=0, help="stop each worker after this many operations (0 = no limit)")
+    parser.add_argument("--seed-startups", type=int, default=20, help="startups created before the run")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help="operation weights, e.g. 'update_funding=5,delete_startup=1'")
+    parser.add_argument("--no-lock-stats", action="store_true", help="skip per-operation lock-wait measurement")
+    parser.add_argument("--keep-data", action="store_true", help=f"do not delete '{SIM_PREFIX}' rows afterwards")
+    args = parser.parse_args()
+
+    conn = mysql.connector.connect(**DB_CONFIG)
+    try:
+        state = load_state(conn, args.seed_startups)
+        lock_before = read_innodb_row_locks(conn)
+
+        start = time.monotonic()
+        workers = [Worker(state, args.mix, start + args.duration, args.ops_per_worker, not args.no_lock_stats)
+                   for _ in range(args.workers)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.monotonic() - start
+
+        lock_after = read_innodb_row_locks(conn)
+
+        failed = [w.fatal_error for w in workers if w.fatal_error]
+        if failed:
+            print(f"{len(failed)} worker(s) could not connect: {failed[0]}")
+
+        totals = {op: OpStats() for op in args.mix}
+        for worker in workers:
+            for op, stats in worker.stats.items():
+                totals[op].merge(stats)
+        print_report(totals, elapsed, args.workers, lock_before, lock_after)
+
+        if not args.keep_data:
+            print(f"\nCleanup: removed {cleanup(conn)} simulated startups.")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+# network_graph.py
+# In-memory index of the startup network:
+#   funding          -> investor <-> startup edges
+#   startup_mentors  -> startup  <-> mentor  edges
+# Edges are stored as CSR arrays (offsets + targets) with a small overlay for incremental
+# changes, which is folded back into the arrays once it grows.
+import heapq
+from array import array
+from collections import Counter, deque
+
+GRAPH_TABLES = ("startups", "investors", "mentors", "funding", "startup_mentors")
+
+NAME_QUERIES = {
+    "startup": "SELECT startup_id, name FROM startups",
+    "investor": "SELECT investor_id, name FROM investors",
+    "mentor": "SELECT mentor_id, name FROM mentors",
+}
+
+MIN_OVERLAY_BEFORE_COMPACT = 1024
+
+
+class CSRGraph:
+    # Undirected graph over dense node ids (0 .. n-1).
+    def __init__(self):
+        self.offsets = array('q', [0])
+        self.targets = array('q')
+        self.added = {}        # node -> set of neighbours added since the last build
+        self.removed = set()   # (u, v) pairs removed since the last build (both directions)
+        self.overlay_size = 0
+
+    def build(self, num_nodes, edges):
+        # Counting sort of the edge list into CSR form
+        degree = array('q', bytes(8 * num_nodes))
+        for u, v in edges:
+            degree[u] += 1
+            degree[v] += 1
+
+        offsets = array('q', bytes(8 * (num_nodes + 1)))
+        for node in range(num_nodes):
+            offsets[node + 1] = offsets[node] + degree[node]
+
+        targets = array('q', bytes(8 * offsets[num_nodes]))
+        fill = array('q', offsets[:num_nodes])
+        for u, v in edges:
+            targets[fill[u]] = v
+            fill[u] += 1
+            targets[fill[v]] = u
+            fill[v] += 1
+
+        self.offsets = offsets
+        self.targets = targets
+        self.added = {}
+        self.removed = set()
+        self.overlay_size = 0
+
+    def neighbors(self, u):
+        if u < len(self.offsets) - 1:
+            start, end = self.offsets[u], self.offsets[u + 1]
+            if self.removed:
+                for v in self.targets[start:end]:
+                    if (u, v) not in self.removed:
+                        yield v
+            else:
+                yield from self.targets[start:end]
+        yield from self.added.get(u, ())
+
+    def edges(self):
+        for u in range(max(len(self.offsets) - 1, max(self.added, default=-1) + 1)):
+            for v in self.neighbors(u):
+                if u < v:
+                    yield u, v
+
+    def add_edge(self, u, v):
+        if (u, v) in self.removed:
+            self.removed.discard((u, v))
+            self.removed.discard((v, u))
+        else:
+            self.added.setdefault(u, set()).add(v)
+            self.added.setdefault(v, set()).add(u)
+        self.overlay_size += 1
+
+    def remove_edge(self, u, v):
+        if v in self.added.get(u, ()):
+            self.added[u].discard(v)
+            self.added[v].discard(u)
+        else:
+            self.removed.add((u, v))
+            self.removed.add((v, u))
+        self.overlay_size += 1
+
+    def needs_compaction(self):
+        return self.overlay_size > max(MIN_OVERLAY_BEFORE_COMPACT, len(self.targets) // 10)
+
+
+class NetworkGraph:
+    def __init__(self):
+        self.node_index = {}   # (kind, db_id) -> node
+        self.node_kind = []    # node -> 'startup' / 'investor' / 'mentor'
+        self.node_db_id = []   # node -> primary key in its table
+        self.node_name = []    # node -> display name
+
+        self.funding_graph = CSRGraph()     # investor <-> startup
+        self.mentor_graph = CSRGraph()      # startup  <-> mentor
+        self.funding_edges = {}             # funding_id -> (startup node, investor node)
+        self.funding_counts = Counter()     # (startup node, investor node) -> number of funding rows
+
+    # --- Loading ---
+    def load(self, cursor):
+        # Call on a fresh instance
+        for kind, query in NAME_QUERIES.items():
+            cursor.execute(query)
+            for db_id, name in cursor.fetchall():
+                self.set_name(kind, db_id, name)
+
+        cursor.execute("SELECT funding_id, startup_id, investor_id FROM funding")
+        for funding_id, startup_id, investor_id in cursor.fetchall():
+            if startup_id is not None and investor_id is not None:
+                edge = (self.node("startup", startup_id), self.node("investor", investor_id))
+                self.funding_edges[funding_id] = edge
+                self.funding_counts[edge] += 1
+
+        cursor.execute("SELECT startup_id, mentor_id FROM startup_mentors")
+        mentor_edges = [(self.node("startup", s), self.node("mentor", m)) for s, m in cursor.fetchall()]
+
+        self.funding_graph.build(len(self.node_kind), list(self.funding_counts))
+        self.mentor_graph.build(len(self.node_kind), mentor_edges)
+
+    def node(self, kind, db_id):
+        key = (kind, int(db_id))
+        node = self.node_index.get(key)
+        if node is None:
+            node = len(self.node_kind)
+            self.node_index[key] = node
+            self.node_kind.append(kind)
+            self.node_db_id.append(int(db_id))
+            self.node_name.append(f"{kind} {db_id}")
+        return node
+
+    def label(self, node):
+        return f"{self.node_kind[node].title()}: {self.node_name[node]}"
+
+    # --- Incremental Updates ---
+    def set_name(self, kind, db_id, name):
+        self.node_name[self.node(kind, db_id)] = name
+
+    def set_funding(self, funding_id, startup_id, investor_id):
+        self.remove_funding(funding_id)
+        if startup_id is None or investor_id is None:
+            return
+        edge = (self.node("startup", startup_id), self.node("investor", investor_id))
+        self.funding_edges[funding_id] = edge
+        self.funding_counts[edge] += 1
+        if self.funding_counts[edge] == 1:
+            self.funding_graph.add_edge(*edge)
+        self._compact_if_needed()
+
+    def remove_funding(self, funding_id):
+        edge = self.funding_edges.pop(funding_id, None)
+        if edge is None:
+            return
+        self.funding_counts[edge] -= 1
+        if self.funding_counts[edge] == 0:
+            del self.funding_counts[edge]
+            self.funding_graph.remove_edge(*edge)
+            self._compact_if_needed()
+
+    def add_mentorship(self, startup_id, mentor_id):
+        s, m = self.node("startup", startup_id), self.node("mentor", mentor_id)
+        if m not in self.mentor_graph.neighbors(s):
+            self.mentor_graph.add_edge(s, m)
+            self._compact_if_needed()
+
+    def remove_mentorship(self, startup_id, mentor_id):
+        s, m = self.node("startup", startup_id), self.node("mentor", mentor_id)
+        if m in self.mentor_graph.neighbors(s):
+            self.mentor_graph.remove_edge(s, m)
+            self._compact_if_needed()
+
+    def remove_node_edges(self, kind, db_id):
+        # A deleted startup/investor/mentor loses all its edges (ON DELETE CASCADE / SET NULL)
+        node = self.node_index.get((kind, int(db_id)))
+        if node is None:
+            return
+        for funding_id in [f for f, edge in self.funding_edges.items() if node in edge]:
+            self.remove_funding(funding_id)
+        for other in list(self.mentor_graph.neighbors(node)):
+            self.mentor_graph.remove_edge(node, other)
+        self._compact_if_needed()
+
+    def apply_rows(self, table, column_names, row_keys, rows):
+        # Applies change-feed results: rows[key] is the current row, missing if it was deleted
+        for key in row_keys:
+            row = rows.get(key)
+            values = dict(zip(column_names, row)) if row is not None else None
+
+            if table == "funding":
+                if values is None:
+                    self.remove_funding(int(key))
+                else:
+                    self.set_funding(values["funding_id"], values["startup_id"], values["investor_id"])
+            elif table == "startup_mentors":
+                startup_id, mentor_id = key.split("-")
+                if values is None:
+                    self.remove_mentorship(startup_id, mentor_id)
+                else:
+                    self.add_mentorship(startup_id, mentor_id)
+            else:
+                kind = table[:-1]  # startups -> startup, ...
+                if values is None:
+                    self.remove_node_edges(kind, key)
+                else:
+                    self.set_name(kind, key, values["name"])
+
+    def _compact_if_needed(self):
+        for graph in (self.funding_graph, self.mentor_graph):
+            if graph.needs_compaction():
+                graph.build(len(self.node_kind), list(graph.edges()))
+
+    # --- Queries ---
+    def top_co_investors(self, limit=20):
+        # Investor pairs ranked by the number of startups both have funded
+        pairs = Counter()
+        for node, kind in enumerate(self.node_kind):
+            if kind != "startup":
+                continue
+            investors = sorted(self.funding_graph.neighbors(node))
+            for i, a in enumerate(investors):
+                for b in investors[i + 1:]:
+                    pairs[(a, b)] += 1
+        return [(self.node_name[a], self.node_name[b], count)
+                for (a, b), count in heapq.nlargest(limit, pairs.items(), key=lambda item: item[1])]
+
+    def top_shared_mentor_startups(self, limit=20):
+        # Startup pairs ranked by the number of mentors they share
+        pairs = Counter()
+        for node, kind in enumerate(self.node_kind):
+            if kind != "mentor":
+                continue
+            startups = sorted(self.mentor_graph.neighbors(node))
+            for i, a in enumerate(startups):
+                for b in startups[i + 1:]:
+                    pairs[(a, b)] += 1
+        return [(self.node_name[a], self.node_name[b], count)
+                for (a, b), count in heapq.nlargest(limit, pairs.items(), key=lambda item: item[1])]
+
+    def shortest_path(self, investor_id, startup_id):
+        # Breadth-first search over funding and mentorship edges.
+        # Returns the list of node labels from investor to startup, or [] if they are not connected.
+        source = self.node_index.get(("investor", int(investor_id)))
+        target = self.node_index.get(("startup", int(startup_id)))
+        if source is None or target is None:
+            return []
+
+        parent = {source: None}
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            if node == target:
+                path = []
+                while node is not None:
+                    path.append(self.label(node))
+                    node = parent[node]
+                return path[::-1]
+            for graph in (self.funding_graph, self.mentor_graph):
+                for neighbor in graph.neighbors(node):
+                    if neighbor not in parent:
+                        parent[neighbor] = node
+                        queue.append(neighbor)
+        return []
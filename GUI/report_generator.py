@@ -0,0 +1,305 @@
+# report_generator.py
+# Batch portfolio reports: one HTML file per startup (founders, mentors, funding history,
+# fn_GetTotalFunding, fn_GetMentorCount and the trigger-written audit_log trail).
+#
+# All data is fetched with a handful of set-based queries, then the reports are rendered
+# in parallel with a process pool. A manifest of content hashes lets later runs
+# regenerate only the startups whose data changed.
+#
+# Usage: python report_generator.py [--output reports] [--all]
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import mysql.connector
+
+MANIFEST_FILE = "manifest.json"
+MIN_BATCH_FOR_POOL = 50  # Smaller batches render faster in-process than starting workers
+
+STARTUPS_QUERY = """
+SELECT startup_id, name, domain, stage, registration_date,
+       fn_GetTotalFunding(startup_id), fn_GetMentorCount(startup_id)
+FROM startups
+"""
+
+FOUNDERS_QUERY = """
+SELECT startup_id, name, email, contact
+FROM founders
+ORDER BY startup_id, founder_id
+"""
+
+MENTORS_QUERY = """
+SELECT sm.startup_id, m.name, m.expertise_area
+FROM startup_mentors sm
+JOIN mentors m ON sm.mentor_id = m.mentor_id
+ORDER BY sm.startup_id, m.name
+"""
+
+FUNDING_QUERY = """
+SELECT f.startup_id, f.funding_id, i.name, f.amount, f.date
+FROM funding f
+LEFT JOIN investors i ON f.investor_id = i.investor_id
+ORDER BY f.startup_id, f.date, f.funding_id
+"""
+
+# Audit trail: the rows written by the audit triggers (same table as the Audit Log viewer)
+AUDIT_QUERY = "SELECT * FROM audit_log ORDER BY action_timestamp"
+
+# audit_log rows are free text, so they are attributed to startups by what they mention
+FUNDING_ID_PATTERN = re.compile(r"funding[ _]?(?:id)?\D{0,5}(\d+)", re.IGNORECASE)
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+WORD_PATTERN = re.compile(r"\w+")
+
+
+# ===================================================================
+# Data Fetching (main process)
+# ===================================================================
+def fetch_report_data(cursor):
+    # Returns {startup_id: payload}; payloads only hold plain strings/numbers so they
+    # can be hashed and sent to worker processes cheaply.
+    cursor.execute(STARTUPS_QUERY)
+    payloads = {}
+    for startup_id, name, domain, stage, registered, total, mentor_count in cursor.fetchall():
+        payloads[startup_id] = {
+            "startup_id": startup_id,
+            "name": name,
+            "domain": domain or "",
+            "stage": stage or "",
+            "registration_date": str(registered or ""),
+            "total_funding": str(total or 0),
+            "mentor_count": int(mentor_count or 0),
+            "founders": [],
+            "mentors": [],
+            "funding": [],
+            "audit_columns": [],
+            "audit": [],
+        }
+
+    sections = [
+        (FOUNDERS_QUERY, "founders"),
+        (MENTORS_QUERY, "mentors"),
+        (FUNDING_QUERY, "funding"),
+    ]
+    for query, section in sections:
+        cursor.execute(query)
+        for row in cursor.fetchall():
+            payload = payloads.get(row[0])
+            if payload is not None:
+                payload[section].append([str(v) if v is not None else "" for v in row[1:]])
+
+    cursor.execute(AUDIT_QUERY)
+    audit_columns = [desc[0] for desc in cursor.description]
+    attribute_audit_rows(payloads, audit_columns, cursor.fetchall())
+    return payloads
+
+
+def name_key(name):
+    # 'Arjun Mehta' -> ('arjun', 'mehta'); names are matched word by word
+    return tuple(WORD_PATTERN.findall(name.lower()))
+
+
+def names_in(words, by_name, name_lengths):
+    # Startup IDs of the names (keys of by_name) found in the word list, longest match first
+    startup_ids = set()
+    i = 0
+    while i < len(words):
+        for length in name_lengths:
+            found = by_name.get(tuple(words[i:i + length]))
+            if found:
+                startup_ids |= found
+                i += length
+                break
+        else:
+            i += 1
+    return startup_ids
+
+
+def attribute_audit_rows(payloads, columns, rows):
+    # Adds each audit_log row to the startup(s) it refers to: by a startup_id column if the
+    # table has one, otherwise by the funding IDs, founder emails, founder names and startup
+    # names mentioned in its text. Every lookup is a dict lookup, so the cost grows with the
+    # length of the audit rows, not with the number of startups and founders.
+    by_funding_id, by_email, by_name = {}, {}, {}
+    for startup_id, payload in payloads.items():
+        by_name.setdefault(name_key(payload["name"]), set()).add(startup_id)
+        for name, email, _ in payload["founders"]:
+            by_name.setdefault(name_key(name), set()).add(startup_id)
+            if email:
+                by_email.setdefault(email.lower(), set()).add(startup_id)
+        for funding_id, *_ in payload["funding"]:
+            by_funding_id.setdefault(funding_id, set()).add(startup_id)
+    by_name.pop((), None)
+    name_lengths = sorted({len(key) for key in by_name}, reverse=True)  # Longest match first
+
+    startup_id_index = columns.index("startup_id") if "startup_id" in columns else None
+
+    for payload in payloads.values():
+        payload["audit_columns"] = list(columns)
+
+    for row in rows:
+        values = [str(v) if v is not None else "" for v in row]
+        if startup_id_index is not None:
+            startup_ids = {row[startup_id_index]}
+        else:
+            text = " ".join(values)
+            lowered = text.lower()
+            startup_ids = set()
+            for funding_id in FUNDING_ID_PATTERN.findall(text):
+                startup_ids |= by_funding_id.get(funding_id, set())
+            for email in EMAIL_PATTERN.findall(lowered):
+                startup_ids |= by_email.get(email, set())
+            startup_ids |= names_in(WORD_PATTERN.findall(lowered), by_name, name_lengths)
+
+        for startup_id in startup_ids:
+            payload = payloads.get(startup_id)
+            if payload is not None:
+                payload["audit"].append(values)
+
+
+def payload_hash(payload):
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def report_filename(startup_id):
+    return f"startup_{startup_id}.html"
+
+
+# ===================================================================
+# Rendering (worker processes)
+# ===================================================================
+def html_table(headers, rows):
+    if not rows:
+        return "<p><em>None</em></p>"
+    head = "".join(f"<th>{html.escape(h)}</th>" for h in headers)
+    body = "".join("<tr>" + "".join(f"<td>{html.escape(str(v))}</td>" for v in row) + "</tr>" for row in rows)
+    return f"<table><tr>{head}</tr>{body}</table>"
+
+
+def render_report(payload):
+    p = payload
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{html.escape(p["name"])} - Portfolio Report</title>
+<style>
+body {{ font-family: Arial, sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; margin-bottom: 1.5em; }}
+th, td {{ border: 1px solid #999; padding: 4px 10px; text-align: left; }}
+th {{ background: #347083; color: white; }}
+</style>
+</head>
+<body>
+<h1>{html.escape(p["name"])}</h1>
+<p>Domain: {html.escape(p["domain"])} &nbsp;|&nbsp; Stage: {html.escape(p["stage"])} &nbsp;|&nbsp; Registered: {html.escape(p["registration_date"])}</p>
+<p><strong>Total Funding (fn_GetTotalFunding):</strong> {float(p["total_funding"]):,.2f}
+&nbsp;|&nbsp; <strong>Mentors (fn_GetMentorCount):</strong> {p["mentor_count"]}</p>
+<h2>Founders</h2>
+{html_table(["Name", "Email", "Contact"], p["founders"])}
+<h2>Mentors</h2>
+{html_table(["Name", "Expertise"], p["mentors"])}
+<h2>Funding History</h2>
+{html_table(["Funding ID", "Investor", "Amount", "Date"], p["funding"])}
+<h2>Audit Trail</h2>
+{html_table(p["audit_columns"], p["audit"])}
+</body>
+</html>
+"""
+
+
+def write_report(job):
+    output_dir, payload = job
+    path = os.path.join(output_dir, report_filename(payload["startup_id"]))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(render_report(payload))
+    return payload["startup_id"]
+
+
+# ===================================================================
+# Batch Generation
+# ===================================================================
+def load_manifest(output_dir):
+    try:
+        with open(os.path.join(output_dir, MANIFEST_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(output_dir, manifest):
+    with open(os.path.join(output_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+
+
+def generate_reports(db_config, output_dir, only_changed=True, progress=None, max_workers=None):
+    # progress(done, total) is called from this thread after each finished report.
+    # Returns (generated, unchanged, removed) counts.
+    conn = mysql.connector.connect(**db_config)
+    try:
+        cursor = conn.cursor()
+        payloads = fetch_report_data(cursor)
+        cursor.close()
+    finally:
+        conn.close()
+
+    os.makedirs(output_dir, exist_ok=True)
+    old_manifest = load_manifest(output_dir) if only_changed else {}
+    manifest = {}
+    jobs = []
+    for startup_id, payload in payloads.items():
+        key = str(startup_id)
+        manifest[key] = payload_hash(payload)
+        report_exists = os.path.exists(os.path.join(output_dir, report_filename(startup_id)))
+        if old_manifest.get(key) != manifest[key] or not report_exists:
+            jobs.append((output_dir, payload))
+
+    # Reports of startups that no longer exist
+    removed = 0
+    for key in set(load_manifest(output_dir)) - set(manifest):
+        try:
+            os.remove(os.path.join(output_dir, report_filename(key)))
+            removed += 1
+        except OSError:
+            pass
+
+    total = len(jobs)
+    if progress:
+        progress(0, total)
+
+    if total < MIN_BATCH_FOR_POOL:
+        for done, job in enumerate(jobs, start=1):
+            write_report(job)
+            if progress:
+                progress(done, total)
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, total // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for done, _ in enumerate(executor.map(write_report, jobs, chunksize=chunksize), start=1):
+                if progress:
+                    progress(done, total)
+
+    save_manifest(output_dir, manifest)
+    return total, len(payloads) - total, removed
+
+
+def main():
+    from db_config import DB_CONFIG
+
+    parser = argparse.ArgumentParser(description="Generate one HTML portfolio report per startup.")
+    parser.add_argument("--output", default="reports", help="output folder")
+    parser.add_argument("--all", action="store_true", help="regenerate every report, not only changed ones")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    generated, unchanged, removed = generate_reports(DB_CONFIG, args.output, only_changed=not args.all,
+                                                     max_workers=args.workers)
+    print(f"Generated {generated} reports, {unchanged} unchanged, {removed} removed. Output: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# temporal.py
+# Point-in-time ("as of") queries over the trigger-maintained history tables
+# 'startup_history' and 'funding_history' (see 'sql code.txt').
+from datetime import datetime, timedelta
+
+# Latest version of every startup at a given instant. The driving GROUP BY / MIN() is
+# answered by a loose index scan on startup_history (startup_id, valid_from), one jump per
+# startup, and the LATERAL subquery is one index seek per startup on the same index,
+# so the cost grows with the number of startups rather than the number of revisions.
+PORTFOLIO_AS_OF_QUERY = """
+SELECT
+    h.name AS 'Startup',
+    h.stage AS 'Stage',
+    h.funding_rounds AS 'FundingRounds',
+    h.total_funding AS 'TotalFunding'
+FROM (
+    SELECT startup_id
+    FROM startup_history
+    GROUP BY startup_id
+    HAVING MIN(valid_from) <= %(as_of)s
+) s,
+LATERAL (
+    SELECT sh.name, sh.stage, sh.funding_rounds, sh.total_funding, sh.valid_to
+    FROM startup_history sh
+    WHERE sh.startup_id = s.startup_id AND sh.valid_from <= %(as_of)s
+    ORDER BY sh.valid_from DESC, sh.history_id DESC
+    LIMIT 1
+) h
+WHERE h.valid_to > %(as_of)s
+ORDER BY TotalFunding DESC;
+"""
+
+# Funding records of one startup as they were at a given instant
+FUNDING_AS_OF_QUERY = """
+SELECT
+    fh.funding_id AS 'FundingID',
+    i.name AS 'Investor',
+    fh.amount AS 'Amount',
+    fh.date AS 'Date'
+FROM funding_history fh
+LEFT JOIN investors i ON fh.investor_id = i.investor_id
+WHERE fh.startup_id = %(startup_id)s AND fh.valid_from <= %(as_of)s AND fh.valid_to > %(as_of)s
+ORDER BY fh.date, fh.funding_id;
+"""
+
+
+def end_of_day(date_text):
+    # 'YYYY-MM-DD' -> last instant of that day, so changes made during the day are included.
+    # Raises ValueError for invalid dates.
+    day = datetime.strptime(date_text.strip(), "%Y-%m-%d")
+    return day + timedelta(days=1) - timedelta(microseconds=1)
+
+
+def portfolio_as_of_params(as_of):
+    return {"as_of": as_of}
+
+
+def funding_as_of_params(startup_id, as_of):
+    return {"startup_id": startup_id, "as_of": as_of}
+
+
+def portfolio_as_of(cursor, as_of):
+    # Returns (column_names, rows): name, stage, funding rounds and total funding of every
+    # startup that existed at 'as_of' (a datetime).
+    cursor.execute(PORTFOLIO_AS_OF_QUERY, portfolio_as_of_params(as_of))
+    rows = cursor.fetchall()
+    return [desc[0] for desc in cursor.description], rows
+
+
+def funding_as_of(cursor, startup_id, as_of):
+    # Returns (column_names, rows) of the startup's funding records at 'as_of'
+    cursor.execute(FUNDING_AS_OF_QUERY, funding_as_of_params(startup_id, as_of))
+    rows = cursor.fetchall()
+    return [desc[0] for desc in cursor.description], rows